@@ -24,7 +24,7 @@ from brokkr.constants import (
     LEVEL_NAME_SYSTEM,
     LEVEL_NAME_SYSTEM_CLIENT,
     METADATA_VARS,
-    OUTPUT_PATH_DEFAULT,
+    OUTPUT_PATH_DEFAULT_POSIX,
     OUTPUT_SUBPATH_LOG,
     PACKAGE_NAME,
     SYSTEM_SUBPATH_CONFIG,
@@ -115,7 +115,7 @@ DEFAULT_CONFIG_MAIN = {
         "na_marker": "NA",
         "output_filename_client":
             "{output_type}_{system_name}_{unit_number:0>4}_{utc_date!s}",
-        "output_path_client": OUTPUT_PATH_DEFAULT.as_posix(),
+        "output_path_client": OUTPUT_PATH_DEFAULT_POSIX,
         "system_prefix": "",
         "worker_shutdown_wait_s": 10,
         },
@@ -38,6 +38,7 @@ OUTPUT_SUBPATH_TEST = Path("test")
 # Path for general Brokkr output
 OUTPUT_PATH_BASE = Path("~", PACKAGE_NAME)
 OUTPUT_PATH_DEFAULT = OUTPUT_PATH_BASE / OUTPUT_SUBPATH_DEFAULT
+OUTPUT_PATH_DEFAULT_POSIX = OUTPUT_PATH_DEFAULT.as_posix()
 
 # Subpaths of system dir
 SYSTEM_SUBPATH_CONFIG = Path("config")
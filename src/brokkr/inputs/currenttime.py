@@ -3,7 +3,6 @@ Simple input that returns the current time.
 """
 
 # Standard library imports
-import datetime
 import time
 
 # Local imports
@@ -35,7 +34,6 @@ class CurrentTimeInput(brokkr.pipeline.baseinput.ValueInputStep):
                          ignore_na_on_start=True, **value_input_kwargs)
 
     def read_raw_data(self, input_data=None):
-        current_time = datetime.datetime.now(
-            tz=datetime.timezone.utc).timestamp()
+        current_time = time.time()
         raw_data = [current_time]
         return raw_data
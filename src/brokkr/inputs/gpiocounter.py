@@ -40,15 +40,16 @@ class GPIOCounterDevice(brokkr.utils.misc.AutoReprMixin):
         else:
             # Tabulate the number of counts over a given period
             count = -1
+            cutoff_time = time.monotonic() - period_s
             for count, count_time in enumerate(reversed(self._count_times)):
-                if count_time < (time.monotonic() - period_s):
+                if count_time < cutoff_time:
                     break
             else:
                 count += 1
 
         if mean:
-            count = count / max([min([self.time_elapsed_s, period_s]),
-                                 time.get_clock_info("time").resolution])
+            count = count / max(min(self.time_elapsed_s, period_s),
+                                time.get_clock_info("time").resolution)
 
         return count
 
@@ -3,14 +3,19 @@ Read and decode binary network packets, datagram and more.
 """
 
 # Standard library imports
+import selectors
 import socket
 
 # Local imports
 from brokkr.constants import Errors
 import brokkr.pipeline.baseinput
+import brokkr.utils.misc
 import brokkr.utils.network
 
 
+TIMEOUT_S_MIN = 1e-3
+
+
 class NetworkInput(brokkr.pipeline.baseinput.ValueInputStep):
     SOCKET_FAMILY_LOOKUP = {
         "IPV4": socket.AF_INET,
@@ -32,8 +37,9 @@ class NetworkInput(brokkr.pipeline.baseinput.ValueInputStep):
             timeout_s=brokkr.utils.network.TIMEOUT_S_DEFAULT,
             network_kwargs=None,
             binary_decoder=True,
-            persist_socket=False,
+            persist_socket=None,
             reinit_on_null_data=True,
+            drain_backlog=None,
             **value_input_kwargs):
         super().__init__(binary_decoder=binary_decoder, **value_input_kwargs)
         self._host = host
@@ -44,7 +50,9 @@ class NetworkInput(brokkr.pipeline.baseinput.ValueInputStep):
         self._timeout_s = timeout_s
         self._persist_socket = persist_socket
         self._reinit_on_null_data = reinit_on_null_data
+        self._drain_backlog = drain_backlog
         self._socket = None
+        self._selector = None
 
         # Handle socket family and protocol argument conversions
         for attr_name, prefix in [("socket_family", "AF_"),
@@ -63,6 +71,14 @@ class NetworkInput(brokkr.pipeline.baseinput.ValueInputStep):
                         f"not {input_value}")
             setattr(self, f"_{attr_name}", attr_value)
 
+        # Keep datagram sockets open between reads unless told otherwise,
+        # reading the latest datagram so queued ones don't make data stale
+        is_datagram = self._socket_type == socket.SOCK_DGRAM
+        if self._persist_socket is None:
+            self._persist_socket = is_datagram
+        if self._drain_backlog is None:
+            self._drain_backlog = self._persist_socket and is_datagram
+
         # Set up additional arguments to recieve data function
         self._network_kwargs = {} if network_kwargs is None else network_kwargs
         if not self._network_kwargs.get("data_length", None):
@@ -92,8 +108,29 @@ class NetworkInput(brokkr.pipeline.baseinput.ValueInputStep):
             except Exception as e:
                 self.logger.debug("%s closing socket %r: %s",
                                   type(e).__name__, sock, e)
+        else:
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(setup_sock, selectors.EVENT_READ)
         self._socket = setup_sock
 
+    def _close_socket(self):
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        self._socket.close()
+        self._socket = None
+
+    def _read_latest_datagram(self, raw_data):
+        data_length = self._network_kwargs["data_length"]
+        backlog = brokkr.utils.network.drain_datagrams(
+            self._socket, buffer_size=data_length, errors=Errors.LOG)
+        if backlog:
+            self.logger.debug(
+                "Discarding %s older datagrams in favor of most recent",
+                len(backlog))
+            raw_data = backlog[-1][:data_length]
+        return raw_data
+
     def read_raw_data(self, input_data=None):
         self.logger.debug("Reading network data")
         if self._persist_socket:
@@ -106,14 +143,32 @@ class NetworkInput(brokkr.pipeline.baseinput.ValueInputStep):
             self.logger.debug(
                 "Waiting for data from socket %r with kwargs %r",
                 self._socket, self._network_kwargs)
-            raw_data = brokkr.utils.network.recieve_all(
-                self._socket, timeout_s=self._timeout_s, errors=Errors.LOG,
-                **self._network_kwargs)
+            # Poll so that the exit event can interrupt waiting for data
+            wait_start_ns = brokkr.utils.misc.monotonic_ns()
+            if brokkr.utils.network.wait_for_data(
+                    self._selector, timeout_s=self._timeout_s,
+                    exit_event=self.exit_event):
+                timeout_s = self._timeout_s
+                if timeout_s:
+                    # Only spend what is left of the timeout recieving data
+                    wait_s = (
+                        (brokkr.utils.misc.monotonic_ns() - wait_start_ns)
+                        / brokkr.utils.misc.NS_IN_S)
+                    timeout_s = max(timeout_s - wait_s, TIMEOUT_S_MIN)
+                raw_data = brokkr.utils.network.recieve_all(
+                    self._socket, timeout_s=timeout_s,
+                    errors=Errors.LOG, **self._network_kwargs)
+            else:
+                self.logger.debug("No data ready on socket %r in %s s",
+                                  self._socket, self._timeout_s)
+                raw_data = None
+            if (self._drain_backlog and raw_data is not None
+                    and self._socket_type == socket.SOCK_DGRAM):
+                raw_data = self._read_latest_datagram(raw_data)
             if self._reinit_on_null_data and raw_data is None:
                 self.logger.debug(
                     "Data is None, reiniting socket %r", self._socket)
-                self._socket.close()
-                self._socket = None
+                self._close_socket()
         else:
             raw_data = brokkr.utils.network.read_socket_data(
                 host=self._host,
@@ -3,6 +3,7 @@ Ping input class for Brokkr.
 """
 
 # Standard library imports
+import socket
 import subprocess
 
 # Local imports
@@ -12,6 +13,10 @@ import brokkr.utils.misc
 import brokkr.utils.network
 
 
+RESOLVE_AFTER_FAILURES = 5
+RESOLVE_RETRY_INTERVAL_S = 60
+
+
 class PingInput(brokkr.pipeline.baseinput.ValueInputStep):
     def __init__(
             self,
@@ -19,6 +24,8 @@ class PingInput(brokkr.pipeline.baseinput.ValueInputStep):
             timeout_s=brokkr.utils.network.TIMEOUT_S_DEFAULT,
             data_name="ping",
             full_name="Ping Retcode",
+            use_socket=True,
+            resolve_host=True,
             **value_input_kwargs):
         ping_data_type = brokkr.pipeline.datavalue.DataType(
             name=data_name,
@@ -32,11 +39,59 @@ class PingInput(brokkr.pipeline.baseinput.ValueInputStep):
 
         self._host = host
         self._timeout_s = timeout_s
+        self._use_socket = use_socket
+        self._resolve_host = resolve_host
+        self._host_address = None
+        self._resolve_time_ns = None
+        self._failures_since_resolve = 0
 
-    def read_raw_data(self, input_data=None):
+    def resolve_host(self):
+        if not self._resolve_host:
+            return self._host
+        current_time_ns = brokkr.utils.misc.monotonic_ns()
+        # Re-resolve after repeated failures in case the address changed,
+        # and retry failed lookups only periodically as they can block
+        if (self._resolve_time_ns is None
+                or (self._host_address is not None
+                    and self._failures_since_resolve
+                    >= RESOLVE_AFTER_FAILURES)
+                or (self._host_address is None
+                    and (current_time_ns - self._resolve_time_ns)
+                    >= (RESOLVE_RETRY_INTERVAL_S
+                        * brokkr.utils.misc.NS_IN_S))):
+            self._resolve_time_ns = current_time_ns
+            self._failures_since_resolve = 0
+            try:
+                self._host_address = socket.gethostbyname(self._host)
+            except OSError as e:
+                self.logger.debug("%s resolving host %r, using as-is: %s",
+                                  type(e).__name__, self._host, e)
+                self._host_address = None
+            else:
+                self.logger.debug("Resolved host %r to address %r",
+                                  self._host, self._host_address)
+        if self._host_address is None:
+            return self._host
+        return self._host_address
+
+    def ping_socket(self, host):
+        try:
+            sock = brokkr.utils.network.create_icmp_socket()
+        except OSError as e:
+            self.logger.info(
+                "%s creating ICMP socket, falling back to ping command: %s",
+                type(e).__name__, e)
+            self.logger.debug("Error details:", exc_info=True)
+            self._use_socket = False
+            return None
+        output_value = brokkr.utils.network.ping_icmp(
+            host=host, timeout_s=self._timeout_s, sock=sock)
+        return output_value
+
+    def ping_command(self, host):
         try:
             ping_output = brokkr.utils.network.ping(
-                host=self._host, count=1, timeout_s=self._timeout_s)
+                host=host, count=1, timeout_s=self._timeout_s)
             output_value = ping_output.returncode
             self.logger.debug("Ping command output: %r", ping_output)
         except subprocess.TimeoutExpired:
@@ -49,6 +104,28 @@ class PingInput(brokkr.pipeline.baseinput.ValueInputStep):
                               type(e).__name__, e)
             self.logger.info("Error details:", exc_info=True)
             output_value = -99
+        return output_value
+
+    def read_raw_data(self, input_data=None):
+        host = self.resolve_host()
+        output_value = None
+        # ICMP sockets are IPv4 only; the ping command handles other hosts
+        if self._use_socket and brokkr.utils.network.is_ipv4_address(host):
+            try:
+                output_value = self.ping_socket(host)
+            except Exception as e:
+                self.logger.error("%s pinging host %r via ICMP socket: %s",
+                                  type(e).__name__, host, e)
+                self.logger.info("Error details:", exc_info=True)
+                output_value = -99
+        if output_value is None:
+            output_value = self.ping_command(host)
+
+        # Only count failures against a resolved address
+        if output_value and self._host_address is not None:
+            self._failures_since_resolve += 1
+        elif not output_value:
+            self._failures_since_resolve = 0
 
         raw_data = [output_value]
         return raw_data
@@ -31,7 +31,7 @@ class BinaryFileOutput(brokkr.pipeline.baseoutput.FileOutputStep):
                 output_item = data_value
             output_data.append(output_item)
 
-        with open(output_file_path, mode="ab") as output_file:
-            for output_item in output_data:
-                output_file.write(output_item)
+        output_file = self.open_output_file(output_file_path, mode="ab")
+        for output_item in output_data:
+            output_file.write(output_item)
         return input_data
@@ -4,6 +4,7 @@ Data output to a CSV file.
 
 # Standard library imports
 import csv
+import io
 
 # Local imports
 import brokkr.pipeline.baseoutput
@@ -27,13 +28,58 @@ class CSVFileOutput(brokkr.pipeline.baseoutput.FileOutputStep):
             csv_kwargs = {}
         self.csv_kwargs = {**CSV_KWARGS_DEFAULT, **csv_kwargs}
 
+        # Row format, precomputed on first write, for values needing no quotes
+        self._dialect = csv.DictWriter(
+            io.StringIO(), fieldnames=[], **self.csv_kwargs).writer.dialect
+        self._quote_chars = {
+            char for char in (self._dialect.quotechar,
+                              self._dialect.escapechar, "\r", "\n") if char}
+        self._fieldnames = None
+        self._row_format = None
+
+    def _update_row_format(self, fieldnames):
+        self._fieldnames = fieldnames
+        if (self._dialect.quoting == csv.QUOTE_MINIMAL
+                and len(fieldnames) > 1):
+            self._row_format = self._dialect.delimiter.join(
+                ["%s"] * len(fieldnames))
+        else:
+            self._row_format = None
+
+    def format_row(self, input_data):
+        fieldnames = tuple(input_data.keys())
+        if fieldnames != self._fieldnames:
+            self._update_row_format(fieldnames)
+        if self._row_format is None:
+            return None
+
+        row_values = tuple(
+            "" if value is None else str(value)
+            for value in input_data.values())
+        row = self._row_format % row_values
+        # Let the csv module handle any values that would need quoting
+        if (row.count(self._dialect.delimiter) != len(row_values) - 1
+                or any(char in row for char in self._quote_chars)):
+            return None
+        return row + self._dialect.lineterminator
+
     def write_file(self, input_data, output_file_path):
         self.logger.debug("Writing output as CSV")
-        with open(output_file_path, mode="a",
-                  encoding="utf-8", newline="") as output_file:
+        output_file = self.open_output_file(
+            output_file_path, mode="a", encoding="utf-8", newline="")
+        csv_writer = None
+        if self._output_file_empty:
+            self.logger.debug("Writing file header")
+            csv_writer = csv.DictWriter(
+                output_file, fieldnames=input_data.keys(), **self.csv_kwargs)
+            csv_writer.writeheader()
+            self._output_file_empty = False
+
+        row = self.format_row(input_data)
+        if row is not None:
+            output_file.write(row)
+            return
+        if csv_writer is None:
             csv_writer = csv.DictWriter(
                 output_file, fieldnames=input_data.keys(), **self.csv_kwargs)
-            if not output_file.tell():
-                self.logger.debug("Writing file header")
-                csv_writer.writeheader()
-            csv_writer.writerow(input_data)
+        csv_writer.writerow(input_data)
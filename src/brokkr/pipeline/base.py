@@ -48,16 +48,34 @@ class Executable(brokkr.utils.misc.AutoReprMixin, metaclass=abc.ABCMeta):
         output_data = self.execute(input_data=input_data)
         return output_data
 
+    def close(self):
+        pass
+
+
+# --- Common utility functions --- #
+
+def close_steps(steps, logger):
+    for step in steps:
+        try:
+            step.close()
+        except Exception as e:
+            logger.error(
+                "%s closing step %s (%s): %s",
+                type(e).__name__, getattr(step, "name", None),
+                brokkr.utils.misc.get_full_class_name(step), e)
+            logger.info("Error details:", exc_info=True)
+
 
 # --- Common mixin classes --- #
 
 class SequentialMixin:
     def execute_step(self, idx, step, input_data=None):
-        self.logger.debug(
-            "Executing step %s of %s - %s (%s) in %s (%s)",
-            idx + 1, len(self.steps), getattr(step, "name", None),
-            brokkr.utils.misc.get_full_class_name(step),
-            self.name, brokkr.utils.misc.get_full_class_name(self))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Executing step %s of %s - %s (%s) in %s (%s)",
+                idx + 1, len(self.steps), getattr(step, "name", None),
+                brokkr.utils.misc.get_full_class_name(step),
+                self.name, brokkr.utils.misc.get_full_class_name(self))
         try:
             output_data = step.execute_(input_data=input_data)
         except Exception as e:
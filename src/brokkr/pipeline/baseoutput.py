@@ -6,12 +6,18 @@ Base classes for pipeline output steps.
 import abc
 import os
 from pathlib import Path
+import time
 
 # Local imports
 import brokkr.pipeline.base
+import brokkr.utils.misc
 import brokkr.utils.output
 
 
+BUFFER_SIZE_BATCHED = 2**16
+FILE_CHECK_INTERVAL_S = 5
+
+
 class FileOutputStep(brokkr.pipeline.base.OutputStep, metaclass=abc.ABCMeta):
     def __init__(
             self,
@@ -20,6 +26,8 @@ class FileOutputStep(brokkr.pipeline.base.OutputStep, metaclass=abc.ABCMeta):
             extension=None,
             filename_kwargs=None,
             drive_kwargs=None,
+            persist_file=True,
+            flush_every_n=1,
             **pipeline_step_kwargs):
         super().__init__(**pipeline_step_kwargs)
 
@@ -29,6 +37,114 @@ class FileOutputStep(brokkr.pipeline.base.OutputStep, metaclass=abc.ABCMeta):
         self.filename_kwargs = (
             {} if filename_kwargs is None else filename_kwargs)
         self.drive_kwargs = {} if drive_kwargs is None else drive_kwargs
+        self.persist_file = persist_file
+        self.flush_every_n = flush_every_n
+        self._output_file = None
+        self._output_file_empty = False
+        self._output_file_check_ns = None
+        self._writes_since_flush = 0
+
+        # Only re-render the output filename when the date changes, if able
+        self._cache_output_path = None
+        self._output_path_key = None
+        self._output_file_path = None
+        self._output_file_path_posix = None
+
+    def get_output_file_path(self):
+        if self._cache_output_path is None:
+            self._cache_output_path = (
+                brokkr.utils.output.is_output_filename_daily(
+                    output_path=self.output_path,
+                    filename_template=self.filename_template,
+                    drive_kwargs=self.drive_kwargs,
+                    ))
+        if self._cache_output_path:
+            output_path_key = (time.gmtime()[:3], time.localtime()[:3])
+            if output_path_key == self._output_path_key:
+                return self._output_file_path
+        else:
+            output_path_key = None
+
+        output_file_path = brokkr.utils.output.render_output_filename(
+            output_path=self.output_path,
+            filename_template=self.filename_template,
+            extension=self.extension,
+            drive_kwargs=self.drive_kwargs,
+            **self.filename_kwargs,
+            )
+        self.logger.debug("Ensuring output directory at %r",
+                          output_file_path.parent.as_posix())
+        os.makedirs(output_file_path.parent, exist_ok=True)
+        self._output_path_key = output_path_key
+        self._output_file_path = output_file_path
+        self._output_file_path_posix = output_file_path.as_posix()
+        return output_file_path
+
+    def open_output_file(self, output_file_path, **open_kwargs):
+        if (self._output_file is not None
+                and self._output_file.name != str(output_file_path)):
+            self.logger.debug("Output file path changed to %r, reopening",
+                              output_file_path.as_posix())
+            self.close_output_file()
+        if (self._output_file is not None
+                and not self._is_output_file_current(output_file_path)):
+            self.logger.info("Output file %r was moved or deleted, reopening",
+                             output_file_path.as_posix())
+            self.close_output_file()
+        if self._output_file is None:
+            if self.persist_file and self.flush_every_n > 1:
+                open_kwargs.setdefault("buffering", BUFFER_SIZE_BATCHED)
+            self.logger.debug("Opening output file at %r with kwargs %r",
+                              output_file_path.as_posix(), open_kwargs)
+            self._output_file = open(output_file_path, **open_kwargs)  # pylint: disable=consider-using-with, unspecified-encoding
+            self._output_file_check_ns = brokkr.utils.misc.monotonic_ns()
+            # Check once here, as tell() on text files flushes the buffer
+            self._output_file_empty = not os.fstat(
+                self._output_file.fileno()).st_size
+        return self._output_file
+
+    def _is_output_file_current(self, output_file_path):
+        # Only check periodically to keep syscalls off most writes
+        current_time_ns = brokkr.utils.misc.monotonic_ns()
+        if (current_time_ns - self._output_file_check_ns) < (
+                FILE_CHECK_INTERVAL_S * brokkr.utils.misc.NS_IN_S):
+            return True
+        self._output_file_check_ns = current_time_ns
+        try:
+            path_stat = os.stat(output_file_path)
+        except FileNotFoundError:
+            return False
+        file_stat = os.fstat(self._output_file.fileno())
+        return ((path_stat.st_dev, path_stat.st_ino)
+                == (file_stat.st_dev, file_stat.st_ino))
+
+    def finish_output_file(self):
+        if self._output_file is None:
+            return
+        if not self.persist_file:
+            self.close_output_file()
+            return
+        # Batch writes to the storage device when requested
+        self._writes_since_flush += 1
+        if self._writes_since_flush >= self.flush_every_n:
+            self._output_file.flush()
+            self._writes_since_flush = 0
+
+    def close_output_file(self):
+        if self._output_file is None:
+            return
+        self.logger.debug("Closing output file %r", self._output_file.name)
+        try:
+            self._output_file.close()
+        except Exception as e:
+            self.logger.warning("%s closing output file %r: %s",
+                                type(e).__name__, self._output_file.name, e)
+            self.logger.info("Error details:", exc_info=True)
+        self._output_file = None
+        self._writes_since_flush = 0
+
+    def close(self):
+        self.close_output_file()
 
     @abc.abstractmethod
     def write_file(self, input_data, output_file_path):
@@ -36,35 +152,30 @@ class FileOutputStep(brokkr.pipeline.base.OutputStep, metaclass=abc.ABCMeta):
 
     def execute(self, input_data=None):
         try:
-            output_file_path = brokkr.utils.output.render_output_filename(
-                output_path=self.output_path,
-                filename_template=self.filename_template,
-                extension=self.extension,
-                drive_kwargs=self.drive_kwargs,
-                **self.filename_kwargs,
-                )
+            output_file_path = self.get_output_file_path()
         except Exception as e:
             self.logger.error(
                 "%s finding output directory %r: %s",
                 type(e).__name__, self.output_path, e)
             self.logger.info("Error details:", exc_info=True)
             return input_data
-        self.logger.debug("Ensuring output directory at %r",
-                          output_file_path.parent.as_posix())
-        os.makedirs(output_file_path.parent, exist_ok=True)
         self.logger.debug("Writing data to file at %r",
-                          output_file_path.as_posix())
+                          self._output_file_path_posix)
         try:
             self.write_file(input_data, output_file_path=output_file_path)
+            self.finish_output_file()
             self.logger.debug("Data successfully written to file at %r",
-                              output_file_path.as_posix())
-            return input_data
+                              self._output_file_path_posix)
         except Exception as e:
             self.logger.error(
                 "%s writing output data to file at %r: %s",
-                type(e).__name__, output_file_path.as_posix(), e)
+                type(e).__name__, self._output_file_path_posix, e)
             data_repr = repr(input_data)
             if len(data_repr) > 1000:
                 data_repr = data_repr[:1000] + " <snipped at 1000 chars>"
             self.log_helper.log(data=data_repr)
-            return input_data
+            self.close_output_file()
+            self._output_path_key = None
+        if self.exit_event is not None and self.exit_event.is_set():
+            self.close_output_file()
+        return input_data
@@ -4,6 +4,7 @@ Build pipelines to be executed by a MultiprocessHandler.
 
 # Standard library imports
 import copy
+import functools
 import importlib
 import importlib.util
 import logging
@@ -45,6 +46,16 @@ def build_queues(input_dict, output_dict=None):
     return output_dict
 
 
+@functools.lru_cache(maxsize=None)
+def load_plugin_module(module_path):
+    LOGGER.debug("Loading plugin module from %r", module_path.as_posix())
+    module_spec = importlib.util.spec_from_file_location(
+        ".".join([PLUGIN_SUBPACKAGE, module_path.stem]), module_path)
+    module_object = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module_object)
+    return module_object
+
+
 # --- Helper classes --- #
 
 class BuildContext(brokkr.utils.misc.AutoReprMixin):
@@ -326,10 +337,7 @@ class ObjectBuilder(Builder):
                 module_path = build_context.plugin_root_path / module_path
             if not module_path.suffix:
                 module_path = module_path.with_suffix(PLUGIN_SUFFIX_DEFAULT)
-            module_spec = importlib.util.spec_from_file_location(
-                ".".join([PLUGIN_SUBPACKAGE, module_path.stem]), module_path)
-            module_object = importlib.util.module_from_spec(module_spec)
-            module_spec.loader.exec_module(module_object)
+            module_object = load_plugin_module(module_path.resolve())
         else:
             module_object = importlib.import_module(self.module_path)
 
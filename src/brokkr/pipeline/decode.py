@@ -189,11 +189,19 @@ class DataDecoder(brokkr.utils.misc.AutoReprMixin):
         self.na_marker = NA_MARKER_DEFAULT if na_marker is None else na_marker
         if conversion_functions is None:
             conversion_functions = {}
-        conversion_functions = {
+        self.conversion_functions = {
             **self.conversion_functions, **conversion_functions}
         self.include_all_data_each = include_all_data_each
         self.passthrough_none = passthrough_none
 
+        # Look up the conversion for each kept data type once, up front
+        self._conversion_table = tuple(
+            (idx, data_type,
+             self.conversion_functions.get(data_type.conversion, None))
+            for idx, data_type in enumerate(self.data_types)
+            if data_type.conversion)
+        self._uncertainties = {}
+
     def __len__(self):
         return len(self.data_types)
 
@@ -212,30 +220,44 @@ class DataDecoder(brokkr.utils.misc.AutoReprMixin):
                        if data_type.conversion}
         return output_data
 
+    def _get_uncertainty(self, data_type, conversion_function):
+        if data_type.uncertainty is not True:
+            return data_type.uncertainty
+        uncertainty = self._uncertainties.get(data_type.name, None)
+        if uncertainty is None:
+            uncertainty = abs(
+                conversion_function(1, **data_type.conversion_kwargs)
+                - conversion_function(0, **data_type.conversion_kwargs))
+            uncertainty = round(
+                uncertainty, -int(math.floor(math.log10(uncertainty))))
+            self._uncertainties[data_type.name] = uncertainty
+        return uncertainty
+
     def convert_data(self, raw_data):
         error_count = 0
         output_data = {}
 
-        for idx, data_type in enumerate(self.data_types):
-            if not data_type.conversion:
-                continue  # If this data value should be dropped, ignore it
-            value = raw_data
-            # Split input into items if each corresponds to one output
-            if (not self.include_all_data_each
-                    and isinstance(value, collections.abc.Sequence)
-                    and not isinstance(value, (bytes, bytearray, str))):
-                value = value[idx]
+        # Split input into items if each corresponds to one output
+        split_data = (
+            not self.include_all_data_each
+            and isinstance(raw_data, collections.abc.Sequence)
+            and not isinstance(raw_data, (bytes, bytearray, str)))
+
+        for idx, data_type, conversion_function in self._conversion_table:
+            value = raw_data[idx] if split_data else raw_data
             if value is None:
+                na_value = self.output_na_value(data_type)
                 LOGGER.debug("Data value is None decoding data_type %s to %s, "
                              "coercing to NA value %r",
-                             data_type.name, data_type.conversion,
-                             self.output_na_value(data_type))
-                output_data[data_type.name] = self.output_na_value(data_type)
+                             data_type.name, data_type.conversion, na_value)
+                output_data[data_type.name] = na_value
                 continue
             try:
-                output_value = (
-                    self.conversion_functions[data_type.conversion](
-                        value, **data_type.conversion_kwargs))
+                if conversion_function is None:
+                    conversion_function = self.conversion_functions[
+                        data_type.conversion]
+                output_value = conversion_function(
+                    value, **data_type.conversion_kwargs)
                 if data_type.digits is not None:
                     output_value = round(output_value, data_type.digits)
             # Handle errors decoding specific values
@@ -256,32 +278,24 @@ class DataDecoder(brokkr.utils.misc.AutoReprMixin):
                 output_data[data_type.name] = self.output_na_value(data_type)
                 error_count += 1
             else:
-                if data_type.uncertainty is True:
-                    uncertainty = abs(
-                        self.conversion_functions[data_type.conversion](
-                            1, **data_type.conversion_kwargs)
-                        - self.conversion_functions[data_type.conversion](
-                            0, **data_type.conversion_kwargs))
-                    uncertainty = round(
-                        uncertainty, -int(math.floor(math.log10(uncertainty))))
-
-                else:
-                    uncertainty = data_type.uncertainty
                 data_value = brokkr.pipeline.datavalue.DataValue(
                     output_value, data_type=data_type, raw_value=value,
-                    uncertainty=uncertainty)
+                    uncertainty=self._get_uncertainty(
+                        data_type, conversion_function))
                 output_data[data_type.name] = data_value
 
         if error_count > 1:
             LOGGER.warning("%s additional decode errors were suppressed.",
                            error_count - 1)
 
-        LOGGER.debug("Converted data: {%s}", brokkr.utils.output.format_data(
-            data=output_data,
-            seperator=", ",
-            include_raw=True,
-            item_limit=128,
-            ))
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Converted data: {%s}", brokkr.utils.output.format_data(
+                    data=output_data,
+                    seperator=", ",
+                    include_raw=True,
+                    item_limit=128,
+                    ))
         return output_data
 
     def decode_data(self, data):
@@ -291,10 +305,12 @@ class DataDecoder(brokkr.utils.misc.AutoReprMixin):
                 LOGGER.debug("Data is None, passing through to pipeline")
             else:
                 output_data = self.output_na_values()
-                LOGGER.debug(
-                    "No data to decode, returning NAs: %r",
-                    brokkr.utils.output.format_data(
-                        data=output_data, seperator=", ", include_raw=False))
+                if LOGGER.isEnabledFor(logging.DEBUG):
+                    LOGGER.debug(
+                        "No data to decode, returning NAs: %r",
+                        brokkr.utils.output.format_data(
+                            data=output_data, seperator=", ",
+                            include_raw=False))
         else:
             output_data = self.convert_data(data)
         return output_data
@@ -308,14 +324,25 @@ class BinaryDataDecoder(DataDecoder):
                 ):
         super().__init__(**data_decoder_kwargs)
         if struct_format is None:
-            struct_format = "!" + "".join(
-                [data_type.input_type for data_type in self.data_types])
+            # Skip dropped values with pad bytes instead of unpacking them
+            skip_dropped = not self.include_all_data_each
+            struct_format = "!" + "".join([
+                data_type.input_type
+                if data_type.conversion or not skip_dropped
+                else f"{struct.calcsize('!' + data_type.input_type)}x"
+                for data_type in self.data_types])
+            if skip_dropped:
+                self._conversion_table = tuple(
+                    (idx, data_type, conversion_function)
+                    for idx, (__, data_type, conversion_function)
+                    in enumerate(self._conversion_table))
         self.struct_format = struct_format
-        self.packet_size = struct.calcsize(self.struct_format)
+        self.struct = struct.Struct(self.struct_format)
+        self.packet_size = self.struct.size
 
     def decode_binary(self, binary_data):
         try:
-            decoded_vals = struct.unpack(self.struct_format, binary_data)
+            decoded_vals = self.struct.unpack(binary_data)
         # Handle overall decoding errors
         except Exception as e:
             if binary_data is not None:
@@ -15,6 +15,9 @@ class MultiStep(brokkr.pipeline.base.PipelineStep, metaclass=abc.ABCMeta):
         super().__init__(**pipeline_step_kwargs)
         self.steps = steps
 
+    def close(self):
+        brokkr.pipeline.base.close_steps(self.steps, logger=self.logger)
+
 
 class SequentialMultiStep(MultiStep, brokkr.pipeline.base.SequentialMixin):
     def execute(self, input_data=None):
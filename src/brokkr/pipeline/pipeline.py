@@ -4,6 +4,7 @@ Core classes for the Pipeline-level components of the Pipeline archetecture.
 
 # Standard library imports
 import abc
+import logging
 import multiprocessing
 
 # Local imports
@@ -36,11 +37,15 @@ class Pipeline(brokkr.pipeline.base.Executable, metaclass=abc.ABCMeta):
             brokkr.utils.misc.get_full_class_name(self))
         self.outer_exit_event.set()
 
+    def close(self):
+        brokkr.pipeline.base.close_steps(self.steps, logger=self.logger)
+
     @abc.abstractmethod
     def execute(self, input_data=None):
-        self.logger.debug(
-            "Executing %s (%s)", self.name,
-            brokkr.utils.misc.get_full_class_name(self))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Executing %s (%s)", self.name,
+                brokkr.utils.misc.get_full_class_name(self))
         if self.exit_event and self.exit_event.is_set():
             if not self.wait_on_exit:
                 self.logger.info("Exit event is set in pipeline %s",
@@ -60,13 +65,17 @@ class Pipeline(brokkr.pipeline.base.Executable, metaclass=abc.ABCMeta):
         if self.na_on_start:
             self.logger.debug("Injecting NA values on start")
             self.execute_(input_data=brokkr.pipeline.utils.NASentinel)
-        brokkr.utils.misc.run_periodic(
-            type(self).execute_,
-            period_s=self.period_s,
-            exit_event=self.exit_event,
-            outer_exit_event=self.outer_exit_event,
-            logger=self.logger,
-            )(self, input_data=input_data)
+        try:
+            brokkr.utils.misc.run_periodic(
+                type(self).execute_,
+                period_s=self.period_s,
+                exit_event=self.exit_event,
+                outer_exit_event=self.outer_exit_event,
+                logger=self.logger,
+                )(self, input_data=input_data)
+        finally:
+            # Flush and close any output still held open by the steps
+            self.close()
 
 
 class SequentialPipeline(Pipeline, brokkr.pipeline.base.SequentialMixin):
@@ -32,6 +32,6 @@ def get_data_values(input_data):
 def is_all_na(input_data, na_values=None):
     na_values = {None} if na_values is None else na_values
     data_objects = get_data_objects(input_data)
-    all_na = all([getattr(data_object, "is_na", data_object in na_values)
-                  for data_object in data_objects])
+    all_na = all(getattr(data_object, "is_na", data_object in na_values)
+                 for data_object in data_objects)
     return all_na
@@ -234,8 +234,10 @@ def generate_quit_handler(exit_event, logger=None):
     return _quit_handler
 
 
-def set_signal_handler(signal_handler, signals=SIGNALS_SET):
+def set_signal_handler(signal_handler, signals=None):
     """Helper function that sets a signal handler for the given signals."""
+    if signals is None:
+        signals = SIGNALS_SET
     for signal_type in signals:
         try:
             signal.signal(getattr(signal, signal_type), signal_handler)
@@ -272,17 +274,20 @@ def run_periodic(
         set_signal_handler(generate_quit_handler(exit_event, logger=logger))
 
         # Mainloop to run at intervals
+        period_ns = int(period_s * NS_IN_S)
         while not outer_exit_event.is_set():
             func(*args, **kwargs)
 
-            if period_s <= 0:
+            if period_ns <= 0:
                 continue
-            next_time = (
-                monotonic_ns() + int(period_s * NS_IN_S)
-                - (monotonic_ns() - START_TIME)
-                % int(period_s * NS_IN_S))
-            while not exit_event.is_set() and monotonic_ns() < next_time:
-                time.sleep(max(0, min(
-                    [SLEEP_TICK_S, (next_time - monotonic_ns()) / NS_IN_S])))
+            current_time = monotonic_ns()
+            next_time = (current_time + period_ns
+                         - (current_time - START_TIME) % period_ns)
+            while not exit_event.is_set():
+                current_time = monotonic_ns()
+                if current_time >= next_time:
+                    break
+                time.sleep(
+                    min(SLEEP_TICK_S, (next_time - current_time) / NS_IN_S))
 
     return _run_periodic
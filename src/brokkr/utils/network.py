@@ -3,14 +3,19 @@ Network-related utility functions.
 """
 
 # Standard library imports
+import ctypes
 import errno
+import functools
+import itertools
 import logging
+import os
 import platform
 import socket
+import struct
 import subprocess
 
 # Local imports
-from brokkr.constants import Errors
+from brokkr.constants import Errors, SLEEP_TICK_S
 import brokkr.utils.log
 import brokkr.utils.misc
 
@@ -23,38 +28,105 @@ MAX_DATA_PRINT_LENGTH = 1024
 TIMEOUT_S_DEFAULT = 2
 SUBPROCESS_TIMEOUT_EXTRA = 2
 
-PING_COUNT_PARAM = "-n" if platform.system().lower() == "windows" else "-c"
+PLATFORM_NAME = platform.system().lower()
+PING_COUNT_PARAM = "-n" if PLATFORM_NAME == "windows" else "-c"
+PING_COMMAND_PREFIX = ("ping", PING_COUNT_PARAM)
 
-ERROR_CODES_ADDRESS_LINK_DOWN = {
+RECVMMSG_VLEN_DEFAULT = 16
+MAX_DRAIN_PACKETS = 2**10
+
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+ICMP_HEADER_FORMAT = "!BBHHH"
+ICMP_PAYLOAD_DEFAULT = b"brokkr"
+ICMP_SEQUENCE = itertools.count(1)
+
+# Return codes matching those of the ping command
+PING_RETCODE_NO_REPLY = 1
+PING_RETCODE_ERROR = 2
+
+ERROR_CODES_ADDRESS_LINK_DOWN = frozenset({
     getattr(errno, "EADDRNOTAVAIL", None),
     getattr(errno, "WSAEADDRNOTAVAIL", None),
-    }
+    })
 
 LOGGER = logging.getLogger(__name__)
 LOG_HELPER = brokkr.utils.log.LogHelper(LOGGER)
 
 
+# --- recvmmsg(2) structures --- #
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t),
+        ]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+        ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_hdr", _MsgHdr),
+        ("msg_len", ctypes.c_uint),
+        ]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_recvmmsg():
+    if PLATFORM_NAME != "linux":
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        recvmmsg = libc.recvmmsg
+    except (OSError, AttributeError) as e:
+        LOGGER.debug("%s loading recvmmsg from libc: %s", type(e).__name__, e)
+        return None
+    recvmmsg.argtypes = [
+        ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint,
+        ctypes.c_int, ctypes.c_void_p]
+    recvmmsg.restype = ctypes.c_int
+    return recvmmsg
+
+
+@functools.lru_cache(maxsize=None)
+def _get_recvmmsg_buffers(buffer_size, vlen):
+    buffers = [ctypes.create_string_buffer(buffer_size) for __ in range(vlen)]
+    iovecs = (_IOVec * vlen)()
+    messages = (_MMsgHdr * vlen)()
+    for iovec, message, buffer in zip(iovecs, messages, buffers):
+        iovec.iov_base = ctypes.cast(buffer, ctypes.c_void_p)
+        iovec.iov_len = buffer_size
+        message.msg_hdr.msg_iov = ctypes.pointer(iovec)
+        message.msg_hdr.msg_iovlen = 1
+    return buffers, iovecs, messages
+
+
 def ping(
         host,
         count=1,
         timeout_s=TIMEOUT_S_DEFAULT,
         record_output=False,
         ):
-    # Set the correct option for the number of packets based on platform.
-    if platform.system().lower() == "windows":
-        count_param = "-n"
-    else:
-        count_param = "-c"
-
     # Build the command, e.g. ping -c 1 -w 1 10.10.10.1
-    command = ["ping", count_param, str(count), "-w", str(timeout_s), host]
-    LOGGER.debug("Running ping command %s ...", " ".join(command))
+    command = [
+        *PING_COMMAND_PREFIX, str(count), "-w", str(timeout_s), host]
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug("Running ping command %s ...", " ".join(command))
     if record_output:
         extra_args = {
             "stdout": subprocess.PIPE,
             "stderr": subprocess.PIPE,
-            "encoding": "utf-8",
-            "errors": "surrogateescape",
             }
     else:
         extra_args = {
@@ -71,6 +143,100 @@ def ping(
     return ping_output
 
 
+def icmp_checksum(data):
+    if len(data) % 2:
+        data += b"\x00"
+    checksum = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    checksum = (checksum >> 16) + (checksum & 0xFFFF)
+    checksum += checksum >> 16
+    return ~checksum & 0xFFFF
+
+
+def is_ipv4_address(host):
+    try:
+        socket.inet_pton(socket.AF_INET, host)
+    except (OSError, TypeError, ValueError):
+        return False
+    return True
+
+
+def create_icmp_socket():
+    # Try an unprivileged ping socket first, then fall back to a raw socket
+    try:
+        sock = socket.socket(
+            socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+    except OSError as e:
+        LOGGER.debug("%s creating unprivileged ICMP socket, "
+                     "trying raw socket: %s", type(e).__name__, e)
+        sock = socket.socket(
+            socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+    LOGGER.debug("Created ICMP socket %r", sock)
+    return sock
+
+
+def ping_icmp(
+        host,
+        timeout_s=TIMEOUT_S_DEFAULT,
+        sequence=None,
+        payload=ICMP_PAYLOAD_DEFAULT,
+        sock=None,
+        ):
+    if sock is None:
+        sock = create_icmp_socket()
+    # Use a new sequence number each time so late replies aren't matched
+    if sequence is None:
+        sequence = next(ICMP_SEQUENCE) & 0xFFFF
+    # The kernel rewrites the identifier for unprivileged ping sockets
+    check_ident = sock.type == socket.SOCK_RAW
+    ident = os.getpid() & 0xFFFF
+
+    header = struct.pack(
+        ICMP_HEADER_FORMAT, ICMP_ECHO_REQUEST, 0, 0, ident, sequence)
+    checksum = icmp_checksum(header + payload)
+    packet = struct.pack(
+        ICMP_HEADER_FORMAT, ICMP_ECHO_REQUEST, 0, checksum, ident, sequence)
+    packet += payload
+
+    with sock:
+        try:
+            LOGGER.debug(
+                "Sending ICMP echo request %r to host %r", packet, host)
+            sock.sendto(packet, (host, 0))
+            end_time = (brokkr.utils.misc.monotonic_ns()
+                        + int(timeout_s * brokkr.utils.misc.NS_IN_S))
+            while True:
+                remaining_s = ((end_time - brokkr.utils.misc.monotonic_ns())
+                               / brokkr.utils.misc.NS_IN_S)
+                if remaining_s <= 0:
+                    break
+                sock.settimeout(remaining_s)
+                try:
+                    reply = sock.recv(BUFFER_SIZE_DEFAULT)
+                except socket.timeout:
+                    break
+                # Strip the IPv4 header, if present (raw sockets, some OSes)
+                if reply and reply[0] >> 4 == 4:
+                    reply = reply[(reply[0] & 0x0F) * 4:]
+                if len(reply) < struct.calcsize(ICMP_HEADER_FORMAT):
+                    continue
+                reply_type, __, __, reply_ident, reply_sequence = (
+                    struct.unpack_from(ICMP_HEADER_FORMAT, reply))
+                if (reply_type == ICMP_ECHO_REPLY
+                        and reply_sequence == sequence
+                        and (not check_ident or reply_ident == ident)):
+                    LOGGER.debug(
+                        "ICMP echo reply recieved from host %r", host)
+                    return 0
+        # Unreachable hosts and networks are expected, so just report them
+        except OSError as e:
+            LOGGER.debug("%s sending ICMP echo request to host %r: %s",
+                         type(e).__name__, host, e)
+            return PING_RETCODE_ERROR
+
+    LOGGER.debug("No ICMP echo reply from host %r in %s s", host, timeout_s)
+    return PING_RETCODE_NO_REPLY
+
+
 def handle_socket_error(e, errors=Errors.RAISE, **log_kwargs):
     if errors == Errors.RAISE:
         raise e
@@ -89,7 +255,7 @@ def handle_socket_error(e, errors=Errors.RAISE, **log_kwargs):
         raise e
 
 
-def setup_socket(  # pylint: disable=dangerous-default-value
+def setup_socket(
         sock,
         address_tuple,
         action,
@@ -126,6 +292,32 @@ def setup_socket(  # pylint: disable=dangerous-default-value
     return sock
 
 
+def wait_for_data(
+        selector,
+        timeout_s=None,
+        exit_event=None,
+        poll_interval_s=SLEEP_TICK_S,
+        ):
+    if exit_event is None:
+        return bool(selector.select(timeout=timeout_s))
+
+    end_time = None
+    if timeout_s is not None:
+        end_time = (brokkr.utils.misc.monotonic_ns()
+                    + int(timeout_s * brokkr.utils.misc.NS_IN_S))
+    while not exit_event.is_set():
+        select_timeout_s = poll_interval_s
+        if end_time is not None:
+            remaining_s = ((end_time - brokkr.utils.misc.monotonic_ns())
+                           / brokkr.utils.misc.NS_IN_S)
+            if remaining_s <= 0:
+                break
+            select_timeout_s = min(poll_interval_s, remaining_s)
+        if selector.select(timeout=select_timeout_s):
+            return True
+    return False
+
+
 def recieve_all(
         sock,
         data_length=None,
@@ -145,7 +337,7 @@ def recieve_all(
                 <= (timeout_s * brokkr.utils.misc.NS_IN_S))):
         try:
             chunk = sock.recv(buffer_size)
-            if len(chunks) == 0:
+            if not chunks and LOGGER.isEnabledFor(logging.DEBUG):
                 LOGGER.debug(
                     "First chunk of network data recieved of length %s bytes",
                     len(chunk))
@@ -178,7 +370,7 @@ def recieve_all(
                     n_chunks=len(chunks), bytes_remaining=bytes_remaining)
             break
         bytes_remaining -= len(chunk)
-        buffer_size = min([buffer_size, bytes_remaining])
+        buffer_size = min(buffer_size, bytes_remaining)
         chunks.append(chunk)
 
     LOGGER.debug("%s total chunks of network data recieved", len(chunks))
@@ -192,7 +384,7 @@ def recieve_all(
 
     if not data:
         LOGGER.debug("Null network data recieved: %r", data)
-    else:
+    elif LOGGER.isEnabledFor(logging.DEBUG):
         LOGGER.debug("Network data recieved of length %s bytes", len(data))
         LOGGER.debug("First %s bytes: %r",
                      MAX_DATA_PRINT_LENGTH, data[:MAX_DATA_PRINT_LENGTH])
@@ -200,6 +392,66 @@ def recieve_all(
     return data
 
 
+def _drain_datagrams_recvmmsg(
+        recvmmsg, sock, buffer_size, vlen, max_packets):
+    buffers, __, messages = _get_recvmmsg_buffers(buffer_size, vlen)
+
+    packets = []
+    while len(packets) < max_packets:
+        n_recieved = recvmmsg(
+            sock.fileno(), messages, vlen, socket.MSG_DONTWAIT, None)
+        if n_recieved < 0:
+            error_code = ctypes.get_errno()
+            if error_code in {errno.EAGAIN, errno.EWOULDBLOCK}:
+                break
+            raise OSError(error_code, os.strerror(error_code))
+        packets += [ctypes.string_at(buffers[idx], messages[idx].msg_len)
+                     for idx in range(n_recieved)]
+        if n_recieved < vlen:
+            break
+    return packets
+
+
+def _drain_datagrams_recv(sock, buffer_size, max_packets):
+    packets = []
+    timeout_s = sock.gettimeout()
+    sock.settimeout(0)
+    try:
+        while len(packets) < max_packets:
+            packets.append(sock.recv(buffer_size))
+    except BlockingIOError:
+        pass
+    finally:
+        sock.settimeout(timeout_s)
+    return packets
+
+
+def drain_datagrams(
+        sock,
+        buffer_size=BUFFER_SIZE_DEFAULT,
+        vlen=RECVMMSG_VLEN_DEFAULT,
+        max_packets=MAX_DRAIN_PACKETS,
+        errors=Errors.RAISE,
+        ):
+    try:
+        recvmmsg = _load_recvmmsg()
+        if recvmmsg is not None:
+            packets = _drain_datagrams_recvmmsg(
+                recvmmsg, sock, buffer_size=buffer_size, vlen=vlen,
+                max_packets=max_packets)
+        else:
+            packets = _drain_datagrams_recv(
+                sock, buffer_size=buffer_size, max_packets=max_packets)
+    except Exception as e:
+        handle_socket_error(e, errors=errors, socket=sock,
+                            buffer_size=buffer_size, vlen=vlen)
+        return None
+
+    LOGGER.debug("%s queued datagrams drained from socket %r",
+                 len(packets), sock)
+    return packets
+
+
 def read_socket_data(
         host,
         port,
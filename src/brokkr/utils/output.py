@@ -8,12 +8,10 @@ import logging
 import os.path
 from pathlib import Path
 import shutil
+import string
 import subprocess
 
 # Local imports
-from brokkr.config.main import CONFIG
-from brokkr.config.metadata import METADATA
-from brokkr.config.unit import UNIT_CONFIG
 import brokkr.utils.misc
 
 
@@ -21,6 +19,8 @@ LOGGER = logging.getLogger(__name__)
 
 MOUNT_TIMEOUT_S = 10
 
+FILENAME_FIELDS_SUBDAILY = {"utc_time", "local_time", "milliseconds"}
+
 
 def apply_item_limit(value, item_limit):
     try:
@@ -74,6 +74,31 @@ def format_data(
     return formatted_data
 
 
+def get_format_fields(format_string):
+    field_names = {
+        field_name.split(".")[0].split("[")[0]
+        for __, field_name, __, __ in string.Formatter().parse(format_string)
+        if field_name}
+    return field_names
+
+
+def is_output_filename_daily(
+        output_path=Path(),
+        filename_template=None,
+        drive_kwargs=None,
+        ):
+    # pylint: disable=import-outside-toplevel
+    if filename_template is None:
+        from brokkr.config.main import CONFIG
+        filename_template = CONFIG["general"]["output_filename_client"]
+    if drive_kwargs and drive_kwargs.get("drive_glob", None) is not None:
+        return False
+
+    field_names = (get_format_fields(str(output_path))
+                   | get_format_fields(filename_template))
+    return not field_names & FILENAME_FIELDS_SUBDAILY
+
+
 def find_drives(drive_glob, base_path, filename_kwargs=None):
     if filename_kwargs is None:
         filename_kwargs = {}
@@ -225,6 +250,10 @@ def render_output_filename(
         drive_kwargs=None,
         **filename_kwargs,
         ):
+    # pylint: disable=import-outside-toplevel
+    from brokkr.config.main import CONFIG
+    from brokkr.config.metadata import METADATA
+    from brokkr.config.unit import UNIT_CONFIG
     if filename_template is None:
         filename_template = CONFIG["general"]["output_filename_client"]
     if extension: